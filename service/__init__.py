@@ -20,6 +20,7 @@ and SQL database
 """
 import sys
 from flask import Flask
+from flask_orjson import OrjsonProvider
 from service import config
 from service.common import log_handlers
 
@@ -33,6 +34,9 @@ def create_app():
     app = Flask(__name__)
     app.config.from_object(config)
 
+    # Serialize and parse all JSON (jsonify, get_json) with orjson
+    app.json = OrjsonProvider(app)
+
     # Initialize Plugins
     # pylint: disable=import-outside-toplevel
     from service.models import db
@@ -54,6 +58,12 @@ def create_app():
         # Set up logging for production
         log_handlers.init_logging(app, "gunicorn.error")
 
+        # Compile the common queries now instead of on the first requests
+        try:
+            models.warm_query_cache()
+        except Exception as error:  # pylint: disable=broad-except
+            app.logger.warning("%s: Query cache warm up skipped", error)
+
         app.logger.info(70 * "*")
         app.logger.info("  S E R V I C E   R U N N I N G  ".center(70, "*"))
         app.logger.info(70 * "*")
@@ -7,3 +7,4 @@ All of the models are stored in this package
 from .persistent_base import db, DataValidationError
 from .order import Order
 from .item import Item
+from .warm_up import warm_query_cache
@@ -33,13 +33,14 @@ class Item(db.Model, PersistentBase):
     """
 
     # Table Schema
-    id = db.Column(db.Integer, primary_key=True)
+    id = db.Column(db.BigInteger, db.Identity(start=1), primary_key=True)
     order_id = db.Column(
-        db.Integer, db.ForeignKey("order.id", ondelete="CASCADE"), nullable=False, index=True
+        db.Integer, db.ForeignKey("order.id", ondelete="CASCADE"), nullable=False
     )
     quantity = db.Column(db.Integer)
     unit_price = db.Column(db.Float)
     name = db.Column(db.String(64))
+    order = db.relationship("Order", back_populates="items")
 
     def __repr__(self):
         return f"<Item {self.name} id=[{self.id}] Order[{self.order_id}]>"
@@ -50,7 +51,9 @@ class Item(db.Model, PersistentBase):
         )
     __table_args__ = (
         db.CheckConstraint('quantity > 0', name='check_quantity_positive'),
-        db.CheckConstraint('unit_price >= 0', name='check_price_non_negative')
+        db.CheckConstraint('unit_price >= 0', name='check_price_non_negative'),
+        # covers the batched "WHERE order_id IN (...)" used to eager load items
+        db.Index('ix_item_order_id_id', 'order_id', 'id'),
     )
 
     def serialize(self) -> dict:
@@ -70,22 +73,18 @@ class Item(db.Model, PersistentBase):
         Args:
             data (dict): A dictionary containing the resource data
         """
-        try:
-            self.order_id = data.get("order_id")
-            self.name = data.get("name")
-            self.quantity = data["quantity"]
-            self.unit_price = data["unit_price"]
-        except AttributeError as error:
-            raise DataValidationError(
-                "Invalid Item attribute: " + error.args[0]) from error
-        except KeyError as error:
-            raise DataValidationError(
-                "Invalid Item: missing " + error.args[0]
-            ) from error
-        except TypeError as error:
+        if not isinstance(data, dict):
             raise DataValidationError(
                 "Invalid Item: body of request contained bad or no data "
-                + str(error)
-            ) from error
+                + type(data).__name__
+            )
+        for key in ("quantity", "unit_price"):
+            if key not in data:
+                raise DataValidationError("Invalid Item: missing " + key)
+
+        self.order_id = data.get("order_id")
+        self.name = data.get("name")
+        self.quantity = data["quantity"]
+        self.unit_price = data["unit_price"]
 
         return self
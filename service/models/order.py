@@ -19,6 +19,8 @@ Persistent Base class for database CRUD functions
 """
 
 import logging
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import raiseload, selectinload
 from .persistent_base import db, PersistentBase, DataValidationError
 from .item import Item
 
@@ -35,24 +37,42 @@ class Order(db.Model, PersistentBase):
 
     # Table Schema
     id = db.Column(db.Integer, primary_key=True)
-    customer_id = db.Column(db.String(16), nullable=False, index=True)
+    customer_id = db.Column(db.String(16), nullable=False)
     # phone number is optional
+    # items are eager loaded with one batched SELECT ... IN per query.
+    # Queries that serialize many Orders should start from select_all(), which
+    # also passes raiseload("*") so that any other lazy load raises instead of
+    # issuing N+1 SELECTs.
+    # Deleting an Order deletes its loaded items too; item.order_id is NOT NULL,
+    # so the items must never be orphaned with an UPDATE ... SET order_id=NULL
     items = db.relationship(
-        "Item", backref="order", passive_deletes=True)
+        "Item", back_populates="order", cascade="all, delete-orphan",
+        passive_deletes=True, lazy="selectin")
+
+    __table_args__ = (
+        # covers lookups of a customer's orders without touching the table
+        db.Index('ix_order_customer_id_id', 'customer_id', 'id'),
+    )
 
     def __repr__(self):
-        return f"<Order {self.id} items=[{self.items}]>"
+        # don't trigger a SELECT just to describe the items in a log message
+        if "items" in inspect(self).unloaded:
+            return f"<Order {self.id} items=unloaded>"
+        return f"<Order {self.id} items={len(self.items)}>"
 
     def serialize(self):
         """Converts an Order into a dictionary"""
-        order = {
+        return {
             "id": self.id,
             "customer_id": self.customer_id,
-            "items": [],
+            "items": [item.serialize() for item in self.items],
         }
-        for item in self.items:
-            order["items"].append(item.serialize())
-        return order
+
+    @classmethod
+    def select_all(cls):
+        """Returns the SELECT for all Orders with their items eager loaded"""
+        # any other lazy load raises so that N+1 queries fail fast
+        return select(cls).options(selectinload(cls.items), raiseload("*"))
 
     def deserialize(self, data):
         """
@@ -65,10 +85,9 @@ class Order(db.Model, PersistentBase):
             self.customer_id = data["customer_id"]
             # handle inner list of items
             items_list = data.get("items", [])
-            for json_item in items_list:
-                item = Item()
-                item.deserialize(json_item)
-                self.items.append(item)
+            self.items.extend(
+                [Item().deserialize(json_item) for json_item in items_list]
+            )
         except AttributeError as error:
             raise DataValidationError(
                 "Invalid Order attribute: " + error.args[0]) from error
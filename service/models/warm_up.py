@@ -0,0 +1,64 @@
+######################################################################
+# Copyright 2016, 2024 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+"""
+Query cache warm up
+
+Runs the statements used by the routes once at start up so that SQLAlchemy
+compiles and caches them before the first real request arrives
+"""
+
+import logging
+from .persistent_base import db
+from .order import Order
+from .item import Item
+
+logger = logging.getLogger("flask.app")
+
+
+def warm_query_cache() -> None:
+    """Compiles the CRUD statements inside a transaction that is rolled back"""
+    logger.info("Warming up the query cache")
+    try:
+        # pylint: disable=unexpected-keyword-arg
+        order = Order(customer_id="warm-up")
+        order.items.append(Item(name="warm-up", quantity=1, unit_price=0))
+        db.session.add(order)
+        db.session.flush()
+        order_id, item_id = order.id, order.items[0].id
+        db.session.expunge_all()
+
+        # reads, the list query is the route's own statement so that it shares
+        # its cache key, but a server side cursor fetches only one row of it
+        db.session.execute(
+            Order.select_all(), execution_options={"yield_per": 1}
+        ).scalars().first()
+        # start from an empty session each time so get() cannot skip its SELECT
+        db.session.expunge_all()
+        db.session.get(Item, item_id)
+        db.session.expunge_all()
+        order = db.session.get(Order, order_id)
+        item = order.items[0]
+
+        # writes
+        item.quantity += 1
+        db.session.flush()
+        db.session.delete(item)
+        db.session.delete(order)
+        db.session.flush()
+    finally:
+        db.session.rollback()
+        db.session.remove()
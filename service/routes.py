@@ -21,9 +21,10 @@ This service implements a REST API that allows you to Create, Read, Update
 and Delete Order
 """
 
+import orjson
 from flask import jsonify, request, url_for, abort
 from flask import current_app as app  # Import Flask application
-from service.models import Order, Item
+from service.models import db, Order, Item
 from service.common import status  # HTTP Status Codes
 
 
@@ -83,7 +84,7 @@ def create_orders():
 
     # Create the order
     order = Order()
-    order.deserialize(request.get_json())
+    order.deserialize(get_json_body())
     order.create()
 
     # Create a message to return
@@ -106,7 +107,7 @@ def list_orders():
     This endpoint will return all Orders
     """
     app.logger.info("Request to list all Orders")
-    orders = Order.all()
+    orders = db.session.execute(Order.select_all()).scalars().all()
     results = [order.serialize() for order in orders]
     return jsonify(results), status.HTTP_200_OK
 
@@ -403,18 +404,23 @@ def delete_item(order_id, item_id):
 
 def check_content_type(content_type):
     """Checks that the media type is correct"""
-    if "Content-Type" not in request.headers:
-        app.logger.error("No Content-Type specified.")
-        abort(
-            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-            f"Content-Type must be {content_type}",
-        )
-
-    if request.headers["Content-Type"] == content_type:
+    request_type = request.headers.get("Content-Type")
+    if request_type == content_type:
         return
 
-    app.logger.error("Invalid Content-Type: %s",
-                     request.headers["Content-Type"])
+    if request_type is None:
+        app.logger.error("No Content-Type specified.")
+    else:
+        app.logger.error("Invalid Content-Type: %s", request_type)
     abort(
         status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, f"Content-Type must be {content_type}"
     )
+
+
+def get_json_body():
+    """Parses the raw request body as JSON using orjson"""
+    try:
+        return orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError as error:
+        app.logger.error("Invalid JSON body: %s", error)
+        abort(status.HTTP_400_BAD_REQUEST, "Request body must be valid JSON.")
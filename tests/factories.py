@@ -17,8 +17,10 @@
 """
 Test Factory to make fake objects for testing
 """
-from factory import Factory, SubFactory, Sequence, Faker, post_generation
-from service.models import Item, Order
+from factory import Factory, SubFactory, Sequence, post_generation
+from factory.fuzzy import FuzzyFloat, FuzzyInteger, FuzzyText
+from sqlalchemy import insert
+from service.models import db, Item, Order
 
 
 class OrderFactory(Factory):
@@ -56,7 +58,22 @@ class ItemFactory(Factory):
         model = Item
 
     id = Sequence(lambda n: n)
-    name = Faker("word")
-    quantity = Faker("pyint", min_value=1, max_value=20)
-    unit_price = Faker("pyfloat", min_value=1, max_value=500, right_digits=2)
+    # fuzzy attributes call random directly instead of going through Faker
+    name = FuzzyText(length=8)
+    quantity = FuzzyInteger(1, 20)
+    unit_price = FuzzyFloat(1, 500)
     order = SubFactory(OrderFactory)
+
+
+def bulk_create_orders(count):
+    """Inserts fake Orders with one multi-row INSERT ... RETURNING
+
+    Returns rows with the id and customer_id of each new Order
+    """
+    rows = [{"customer_id": order.customer_id} for order in OrderFactory.build_batch(count)]
+    orders = db.session.execute(
+        insert(Order).returning(Order.id, Order.customer_id, sort_by_parameter_order=True),
+        rows,
+    ).all()
+    db.session.commit()
+    return orders
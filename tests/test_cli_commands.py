@@ -20,7 +20,6 @@ CLI Command Extensions for Flask
 
 # pylint: disable=duplicate-code
 import os
-from unittest import TestCase
 from unittest.mock import patch, MagicMock
 from click.testing import CliRunner
 
@@ -29,16 +28,10 @@ from wsgi import app  # noqa: F401
 from service.common.cli_commands import db_create  # noqa: E402
 
 
-class TestFlaskCLI(TestCase):
-    """Flask CLI Command Tests"""
-
-    def setUp(self):
-        self.runner = CliRunner()
-
-    @patch("service.common.cli_commands.db")
-    def test_db_create(self, db_mock):
-        """It should call the db-create command"""
-        db_mock.return_value = MagicMock()
-        with patch.dict(os.environ, {"FLASK_APP": "wsgi:app"}, clear=True):
-            result = self.runner.invoke(db_create)
-            self.assertEqual(result.exit_code, 0)
+@patch("service.common.cli_commands.db")
+def test_db_create(db_mock):
+    """It should call the db-create command"""
+    db_mock.return_value = MagicMock()
+    with patch.dict(os.environ, {"FLASK_APP": "wsgi:app"}, clear=True):
+        result = CliRunner().invoke(db_create)
+        assert result.exit_code == 0